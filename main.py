@@ -1,21 +1,29 @@
 #!/usr/bin/env python3
 import os
+import random
 import sys
+import time
 from pathlib import Path
 from functools import partial
 
 from PySide6 import QtGui, QtCore, QtWidgets
-from PySide6.QtCore import Qt, QUrl, QTimer
-from PySide6.QtGui import QPixmap, QPainter, QFont, QColor, QIcon
+from PySide6.QtCore import (
+    Qt, QUrl, QTimer, QObject, QRunnable, QThreadPool, Signal, QAbstractListModel,
+    QModelIndex, QDir, QEvent, QRect
+)
+from PySide6.QtGui import QPixmap, QPainter, QFont, QColor, QIcon, QPixmapCache
 from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QListWidget,
-    QLabel, QTreeView, QFileSystemModel, QListWidgetItem, QSplitter, QPushButton,
-    QSlider, QStyle, QComboBox, QStatusBar
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QListView,
+    QLabel, QTreeView, QFileSystemModel, QSplitter, QPushButton,
+    QSlider, QStyle, QComboBox, QStatusBar, QFileIconProvider
 )
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 
 MUSIC_DIR = Path.home() / "Music"
 SUPPORTED_EXTS = (".mp3", ".wav", ".flac", ".ogg", ".m4a")  # basic set
+# lowercase copy for str.endswith() against lowercased file names
+SUPPORTED_EXTS_LOWER = tuple(e.lower() for e in SUPPORTED_EXTS)
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"  # rendered up front by prerender_letters
 
 
 # ---------- Theme palettes (material-inspired minimal palettes) ----------
@@ -53,19 +61,104 @@ THEMES = {
 }
 
 
+def _build_qss(p):
+    """Return the application stylesheet for a theme palette."""
+    bg = p["background"]
+    surface = p["surface"]
+    text = p["text"]
+    accent = p["accent"]
+    # Apply a basic stylesheet using these colors. Minimal but effective.
+    return f"""
+        QMainWindow {{
+            background-color: {bg};
+            color: {text};
+        }}
+        QWidget {{
+            background-color: {surface};
+            color: {text};
+            selection-background-color: {accent};
+        }}
+        QListView {{
+            background-color: {surface};
+            border: 1px solid rgba(255,255,255,0.04);
+        }}
+        QTreeView {{
+            background-color: {surface};
+            border: none;
+        }}
+        QPushButton {{
+            background-color: rgba(255,255,255,0.02);
+            border: none;
+            padding: 6px;
+            border-radius: 6px;
+        }}
+        QPushButton:checked {{
+            background-color: {accent};
+            color: #fff;
+        }}
+        QSlider::groove:horizontal {{
+            height: 8px;
+            background: rgba(255,255,255,0.06);
+            border-radius: 4px;
+        }}
+        QSlider::handle:horizontal {{
+            width: 14px;
+            background: {accent};
+            margin: -4px 0;
+            border-radius: 7px;
+        }}
+        QLabel {{
+            color: {text};
+        }}
+        QComboBox {{
+            background-color: rgba(255,255,255,0.02);
+            padding: 4px;
+            border-radius: 6px;
+        }}
+    """
+
+
+# stylesheets are formatted once here; apply_theme just looks them up
+for _palette in THEMES.values():
+    _palette["_qss"] = _build_qss(_palette)
+del _palette
+
+
 # ---------- Utilities ----------
+_fmt_cache = {}  # whole seconds -> "mm:ss"
+
+
 def format_ms(ms: int):
     """Return mm:ss for milliseconds (safety for -1)."""
     if ms < 0:
         return "--:--"
-    s = int(ms / 1000)
-    m = s // 60
-    s = s % 60
-    return f"{m:02d}:{s:02d}"
+    s = ms // 1000
+    r = _fmt_cache.get(s)
+    if r is None:
+        m, sec = divmod(s, 60)
+        r = f"{m:02d}:{sec:02d}"
+        if len(_fmt_cache) > 4096:
+            _fmt_cache.clear()
+        _fmt_cache[s] = r
+    return r
+
+
+def _letter_font(size: int):
+    font = QFont()
+    font.setBold(True)
+    # size letter to take many pixels
+    font.setPointSize(int(size * 0.45))
+    return font
 
 
 def make_letter_pixmap(letter: str, size: int, bg_color: QColor, text_color: QColor):
-    """Create a square rounded pixmap with a centered letter."""
+    """Return a square rounded pixmap with a centered letter (cached in QPixmapCache)."""
+    letter = letter.upper()
+    key = f"letter-{letter}-{size}-{bg_color.rgba():08x}-{text_color.rgba():08x}"
+    pix = QPixmapCache.find(key)
+    if pix is not None and not pix.isNull():
+        return pix
+
     pix = QPixmap(size, size)
     pix.fill(Qt.transparent)
     painter = QPainter(pix)
@@ -76,20 +169,139 @@ def make_letter_pixmap(letter: str, size: int, bg_color: QColor, text_color: QCo
     painter.drawRoundedRect(0, 0, size, size, radius, radius)
 
     # Draw letter
-    font = QFont()
-    font.setBold(True)
-    # size letter to take many pixels
-    font.setPointSize(int(size * 0.45))
-    painter.setFont(font)
+    painter.setFont(_letter_font(size))
     painter.setPen(text_color)
     rect = pix.rect()
-    painter.drawText(rect, Qt.AlignCenter, letter.upper())
+    painter.drawText(rect, Qt.AlignCenter, letter)
     painter.end()
+    QPixmapCache.insert(key, pix)
     return pix
 
 
+def prerender_letters(size: int, bg_color: QColor, text_color: QColor):
+    """Render A-Z with a single painter session; return {letter: pixmap}."""
+    atlas = QPixmap(size * len(LETTERS), size)
+    atlas.fill(Qt.transparent)
+    painter = QPainter(atlas)
+    painter.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing)
+    radius = int(size * 0.14)
+    # all tiles first, then all letters, so brush/pen are set only once each
+    painter.setBrush(bg_color)
+    painter.setPen(Qt.NoPen)
+    for i in range(len(LETTERS)):
+        painter.drawRoundedRect(i * size, 0, size, size, radius, radius)
+    painter.setFont(_letter_font(size))
+    painter.setPen(text_color)
+    for i, letter in enumerate(LETTERS):
+        painter.drawText(QRect(i * size, 0, size, size), Qt.AlignCenter, letter)
+    painter.end()
+    return {letter: atlas.copy(i * size, 0, size, size) for i, letter in enumerate(LETTERS)}
+
+
+def scan_audio_files(path):
+    """Return the supported audio files in path as (path, name, letter) tuples, sorted by name.
+
+    letter is the upper-cased first character used for the letter icon/cover.
+    """
+    # DirEntry.is_file() reuses the d_type from the directory listing,
+    # so only symlinks cost an extra stat
+    with os.scandir(path) as it:
+        files = [(e.path, e.name, (e.name[:1] or "?").upper()) for e in it
+                 if e.name.lower().endswith(SUPPORTED_EXTS_LOWER) and e.is_file()]
+    files.sort(key=lambda t: t[1])
+    return files
+
+
+class NullIconProvider(QFileIconProvider):
+    """Icon provider that skips the per-file mime/theme lookups of the default one."""
+
+    def icon(self, *args):
+        return QIcon()
+
+
+# ---------- Background directory scan ----------
+class ScanSignals(QObject):
+    # token, scanned directory, [(path, name, letter)]
+    finished = Signal(int, str, list)
+    # token, scanned directory, error message
+    failed = Signal(int, str, str)
+
+
+class DirectoryScanJob(QRunnable):
+    """Scan a directory on a pool thread and report back via a queued signal."""
+
+    def __init__(self, path: Path, token: int):
+        super().__init__()
+        self.path = path
+        self.token = token
+        self.signals = ScanSignals()
+
+    def run(self):
+        try:
+            files = scan_audio_files(self.path)
+        except OSError as e:
+            self.signals.failed.emit(self.token, str(self.path), e.strerror or str(e))
+            return
+        self.signals.finished.emit(self.token, str(self.path), files)
+
+
+# ---------- Track list model ----------
+class TrackListModel(QAbstractListModel):
+    """Tracks of the current folder; letter icons are rendered only when a row is shown."""
+
+    ICON_SIZE = 48
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tracks = []  # list of (path, name, letter), see scan_audio_files
+        self._placeholder = None
+        self._accent = QColor(THEMES["Deep Purple / Pink (default)"]["accent"])
+        self._text_color = QColor("#ffffff")
+        self._letters = {}  # A-Z pixmaps for the current accent
+
+    def set_tracks(self, tracks, placeholder=None):
+        """Replace all rows; placeholder is shown as a single inert row when tracks is empty."""
+        # one reset instead of per-row inserts, so the view relayouts once
+        self.beginResetModel()
+        self._tracks = tracks
+        self._placeholder = placeholder
+        self.endResetModel()
+
+    def set_accent(self, color: QColor):
+        self._accent = color
+        self._letters = prerender_letters(self.ICON_SIZE, color, self._text_color)
+        if self._tracks:
+            self.dataChanged.emit(self.index(0), self.index(len(self._tracks) - 1), [Qt.DecorationRole])
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        if not self._tracks and self._placeholder:
+            return 1
+        return len(self._tracks)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if not self._tracks:
+            return self._placeholder if role == Qt.DisplayRole else None
+        path, name, letter = self._tracks[index.row()]
+        if role == Qt.DisplayRole:
+            return name
+        if role == Qt.DecorationRole:
+            pix = self._letters.get(letter)
+            if pix is None:
+                pix = make_letter_pixmap(letter, self.ICON_SIZE, self._accent, self._text_color)
+            return pix
+        if role == Qt.UserRole:
+            return path
+        return None
+
+
 # ---------- Main Window ----------
 class MusicPlayerWindow(QMainWindow):
+    COVER_SIZE = 64
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Minimal Music Browser")
@@ -118,18 +330,14 @@ class MusicPlayerWindow(QMainWindow):
         splitter.setHandleWidth(6)
         layout.addWidget(splitter)
 
-        # Left: directory tree
-        self.model = QFileSystemModel()
-        self.model.setRootPath(str(MUSIC_DIR if MUSIC_DIR.exists() else Path.home()))
-        self.model.setNameFilters(["*"])
-        self.model.setNameFilterDisables(False)
+        # Left: directory tree. The file system model is built from the event
+        # loop after the tree is first shown, so the window comes up first.
+        self._music_root = str(MUSIC_DIR if MUSIC_DIR.exists() else Path.home())
+        self.model = None
         self.tree = QTreeView()
-        self.tree.setModel(self.model)
-        self.tree.setRootIndex(self.model.index(str(MUSIC_DIR if MUSIC_DIR.exists() else Path.home())))
-        # hide columns other than name
-        for c in range(1, self.model.columnCount()):
-            self.tree.hideColumn(c)
+        self.tree.installEventFilter(self)
         self.tree.setHeaderHidden(True)
+        self.tree.setUniformRowHeights(True)
         self.tree.clicked.connect(self.on_dir_clicked)
         splitter.addWidget(self.tree)
         self.tree.setMinimumWidth(220)
@@ -142,7 +350,7 @@ class MusicPlayerWindow(QMainWindow):
         # Current playlist / directory title + cover art
         header = QHBoxLayout()
         self.cover_label = QLabel()
-        self.cover_label.setFixedSize(64, 64)
+        self.cover_label.setFixedSize(self.COVER_SIZE, self.COVER_SIZE)
         header.addWidget(self.cover_label)
 
         self.playlist_title = QLabel("Select a folder on the left")
@@ -152,30 +360,39 @@ class MusicPlayerWindow(QMainWindow):
         right_layout.addLayout(header)
 
         # Song list
-        self.song_list = QListWidget()
-        self.song_list.itemClicked.connect(self.on_song_clicked)
+        self.track_model = TrackListModel(self)
+        self.song_list = QListView()
+        self.song_list.setModel(self.track_model)
+        # every row is one line plus a same-sized icon: let Qt measure a single row
+        self.song_list.setUniformItemSizes(True)
+        self.song_list.clicked.connect(self.on_song_clicked)
         right_layout.addWidget(self.song_list)
 
         # Player controls
         controls = QHBoxLayout()
 
+        # standard icons are resolved once; the play button swaps between the first two
+        style = self.style()
+        self._icon_play = style.standardIcon(QStyle.SP_MediaPlay)
+        self._icon_pause = style.standardIcon(QStyle.SP_MediaPause)
+
         self.prev_btn = QPushButton()
-        self.prev_btn.setIcon(self.style().standardIcon(QStyle.SP_MediaSkipBackward))
+        self.prev_btn.setIcon(style.standardIcon(QStyle.SP_MediaSkipBackward))
         self.prev_btn.clicked.connect(self.prev_track)
         controls.addWidget(self.prev_btn)
 
         self.play_btn = QPushButton()
-        self.play_btn.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
+        self.play_btn.setIcon(self._icon_play)
         self.play_btn.clicked.connect(self.play_pause)
         controls.addWidget(self.play_btn)
 
         self.stop_btn = QPushButton()
-        self.stop_btn.setIcon(self.style().standardIcon(QStyle.SP_MediaStop))
+        self.stop_btn.setIcon(style.standardIcon(QStyle.SP_MediaStop))
         self.stop_btn.clicked.connect(self.stop)
         controls.addWidget(self.stop_btn)
 
         self.next_btn = QPushButton()
-        self.next_btn.setIcon(self.style().standardIcon(QStyle.SP_MediaSkipForward))
+        self.next_btn.setIcon(style.standardIcon(QStyle.SP_MediaSkipForward))
         self.next_btn.clicked.connect(self.next_track)
         controls.addWidget(self.next_btn)
 
@@ -199,7 +416,7 @@ class MusicPlayerWindow(QMainWindow):
 
         self.seek_slider = QSlider(Qt.Horizontal)
         self.seek_slider.setRange(0, 1000)
-        self.seek_slider.sliderMoved.connect(self.on_seek_slider_moved)
+        self.seek_slider.sliderMoved.connect(self.on_seek_slider_moved, Qt.DirectConnection)
         self.seek_slider.sliderPressed.connect(self._seeker_pressed)
         self.seek_slider.sliderReleased.connect(self._seeker_released)
         seek_layout.addWidget(self.seek_slider)
@@ -216,7 +433,7 @@ class MusicPlayerWindow(QMainWindow):
         self.vol_slider.setRange(0, 100)
         self.vol_slider.setValue(70)
         self.vol_slider.setFixedWidth(120)
-        self.vol_slider.valueChanged.connect(self.on_volume_changed)
+        self.vol_slider.valueChanged.connect(self.on_volume_changed, Qt.DirectConnection)
         bottom_row.addWidget(self.vol_slider)
         bottom_row.addStretch()
         right_layout.addLayout(bottom_row)
@@ -233,174 +450,166 @@ class MusicPlayerWindow(QMainWindow):
         self.audio_out = QAudioOutput()
         self.player.setAudioOutput(self.audio_out)
         self.audio_out.setVolume(self.vol_slider.value() / 100.0)
-        # signals
-        self.player.positionChanged.connect(self.on_position_changed)
-        self.player.durationChanged.connect(self.on_duration_changed)
-        self.player.playbackStateChanged.connect(self.on_playback_state_changed)
-        self.player.sourceChanged.connect(lambda src: None)
+        # signals; the player lives on the GUI thread, so its signals are
+        # delivered directly instead of going through the AutoConnection check
+        self.player.positionChanged.connect(self.on_position_changed, Qt.DirectConnection)
+        self.player.durationChanged.connect(self.on_duration_changed, Qt.DirectConnection)
+        self.player.playbackStateChanged.connect(self.on_playback_state_changed, Qt.DirectConnection)
+        self.player.mediaStatusChanged.connect(self._on_media_status)
 
         # internal playlist handling
-        self.current_playlist = []  # list of file paths
+        self.current_playlist = []  # list of (path, name, letter) tuples
         self.current_index = -1
         self.is_seeking = False
-
-        # Periodic timer to update seeker if not using positionChanged reliably
+        self._has_source = False  # set by play_at_index, cleared by stop
+        # last texts pushed to the labels, to skip redundant repaints
+        self._last_pos_text = ""
+        self._last_dur_text = ""
+        self._last_pos_signal = 0.0
+
+        # directory scans run on the global thread pool; results are matched by token
+        self._scan_token = 0
+        self._scan_job = None
+
+        # Periodic timer to update seeker if not using positionChanged reliably.
+        # It only runs while playing; see on_playback_state_changed.
         self.ui_timer = QTimer()
         self.ui_timer.setInterval(500)
-        self.ui_timer.timeout.connect(self._periodic_update)
-        self.ui_timer.start()
+        self.ui_timer.timeout.connect(self._periodic_update, Qt.DirectConnection)
 
         # apply default theme
+        self._current_qss = None
+        self._letter_atlas = {}  # A-Z cover pixmaps for the current accent
         self.apply_theme(self.theme_combo.currentText())
 
-        # initial directory
-        if MUSIC_DIR.exists():
-            self.tree.setRootIndex(self.model.index(str(MUSIC_DIR)))
-        else:
-            self.tree.setRootIndex(self.model.index(str(Path.home())))
-
     # ---------------- UI behavior ----------------
+    def eventFilter(self, obj, event):
+        if obj is self.tree and event.type() == QEvent.Show and self.model is None:
+            self.tree.removeEventFilter(self)
+            # Show is delivered synchronously inside win.show(); queue the build
+            # so it runs from the event loop, after the first frame is painted
+            QTimer.singleShot(0, self._build_tree_model)
+        return super().eventFilter(obj, event)
+
+    def _build_tree_model(self):
+        self.model = QFileSystemModel()
+        # the tree only browses folders: don't stat files, watch, or look up icons
+        self.model.setFilter(QDir.AllDirs | QDir.NoDotAndDotDot)
+        self._icon_provider = NullIconProvider()
+        self.model.setIconProvider(self._icon_provider)
+        self.model.setOption(QFileSystemModel.DontWatchForChanges, True)
+        self.model.setOption(QFileSystemModel.DontUseCustomDirectoryIcons, True)
+        # setRootPath already returns the root's index; no second index() lookup
+        root_index = self.model.setRootPath(self._music_root)
+        self.tree.setModel(self.model)
+        self.tree.setRootIndex(root_index)
+        # hide columns other than name
+        for c in range(1, self.model.columnCount()):
+            self.tree.hideColumn(c)
+
     def apply_theme(self, theme_name):
         p = THEMES.get(theme_name, list(THEMES.values())[0])
-        bg = p["background"]
-        surface = p["surface"]
-        text = p["text"]
+        qss = p["_qss"]
+        if qss is self._current_qss:
+            return
+        self.setStyleSheet(qss)
+        self._current_qss = qss
         accent = p["accent"]
-        # Apply a basic stylesheet using these colors. Minimal but effective.
-        style = f"""
-            QMainWindow {{
-                background-color: {bg};
-                color: {text};
-            }}
-            QWidget {{
-                background-color: {surface};
-                color: {text};
-                selection-background-color: {accent};
-            }}
-            QListWidget {{
-                background-color: {surface};
-                border: 1px solid rgba(255,255,255,0.04);
-            }}
-            QTreeView {{
-                background-color: {surface};
-                border: none;
-            }}
-            QPushButton {{
-                background-color: rgba(255,255,255,0.02);
-                border: none;
-                padding: 6px;
-                border-radius: 6px;
-            }}
-            QPushButton:checked {{
-                background-color: {accent};
-                color: #fff;
-            }}
-            QSlider::groove:horizontal {{
-                height: 8px;
-                background: rgba(255,255,255,0.06);
-                border-radius: 4px;
-            }}
-            QSlider::handle:horizontal {{
-                width: 14px;
-                background: {accent};
-                margin: -4px 0;
-                border-radius: 7px;
-            }}
-            QLabel {{
-                color: {text};
-            }}
-            QComboBox {{
-                background-color: rgba(255,255,255,0.02);
-                padding: 4px;
-                border-radius: 6px;
-            }}
-        """
-        self.setStyleSheet(style)
         # update cover accent color (we'll pass accent color where needed)
         self._accent_color = QColor(accent)
+        self.track_model.set_accent(self._accent_color)
+        self._letter_atlas = prerender_letters(self.COVER_SIZE, self._accent_color, QColor("#ffffff"))
         # refresh current cover
         self._update_cover_display()
 
     def on_dir_clicked(self, index):
-        # when a directory is clicked, list its mp3s
-        path = Path(self.model.filePath(index))
-        if path.is_file():
-            # if file clicked, go to its parent dir
-            path = path.parent
-        self.load_directory(path)
+        # when a directory is clicked, list its mp3s (the tree only holds directories)
+        self.load_directory(Path(self.model.filePath(index)))
 
     def load_directory(self, path: Path):
         self.playlist_title.setText(str(path))
-        self.song_list.clear()
-        files = []
-        for p in sorted(path.iterdir()):
-            if p.suffix.lower() in SUPPORTED_EXTS and p.is_file():
-                files.append(p)
+        self.track_model.set_tracks([])
+        # the old folder's tracks must not be reachable via next/prev/play meanwhile
+        self.current_playlist = []
+        self.current_index = -1
+        self._update_cover_display()
+        self.status.showMessage("Scanning folder...")
+        # a newer scan makes any result still in flight stale
+        self._scan_token += 1
+        job = DirectoryScanJob(path, self._scan_token)
+        # emitted from a pool thread: always queue onto the GUI thread
+        job.signals.finished.connect(self._on_scan_finished, Qt.QueuedConnection)
+        job.signals.failed.connect(self._on_scan_failed, Qt.QueuedConnection)
+        # keep the signal carrier alive until its result has been delivered
+        self._scan_job = job
+        QThreadPool.globalInstance().start(job)
+
+    def _on_scan_finished(self, token: int, path: str, files: list):
+        if token != self._scan_token:
+            return
+        self._scan_job = None
         if not files:
-            self.song_list.addItem("(no supported audio files found)")
+            self.track_model.set_tracks([], placeholder="(no supported audio files found)")
             self.current_playlist = []
             self.current_index = -1
             self.status.showMessage("No audio files found in the folder.", 5000)
             self._update_cover_display()
             return
 
-        for f in files:
-            item = QListWidgetItem(f.name)
-            item.setData(Qt.UserRole, str(f))
-            letter = f.name[0].upper() if f.name else "?"
-            icon_pixmap = make_letter_pixmap(letter, 48, self._accent_color, QColor("#ffffff"))
-            item.setIcon(QtGui.QIcon(icon_pixmap))
-            self.song_list.addItem(item)
+        self.track_model.set_tracks(files)
 
-        self.current_playlist = [str(f) for f in files]
+        self.current_playlist = files
         self.current_index = 0
         # select first item
-        self.song_list.setCurrentRow(0)
+        self.song_list.setCurrentIndex(self.track_model.index(0))
         self._update_cover_display()
         # Autoplay first track? We'll not autoplay; wait for double-click or play pressed.
         self.status.showMessage(f"Loaded {len(files)} tracks.", 3000)
 
-    def on_song_clicked(self, item: QListWidgetItem):
-        path = item.data(Qt.UserRole)
-        if not path:
+    def _on_scan_failed(self, token: int, path: str, message: str):
+        if token != self._scan_token:
             return
-        try:
-            idx = self.current_playlist.index(path)
-        except ValueError:
-            # not in current playlist (shouldn't happen)
+        self._scan_job = None
+        self.track_model.set_tracks([], placeholder="(folder could not be read)")
+        self.status.showMessage(f"Could not read folder: {message}", 5000)
+
+    def on_song_clicked(self, index: QModelIndex):
+        # the placeholder row carries no path
+        if not index.data(Qt.UserRole):
             return
-        self.play_at_index(idx)
+        # rows map 1:1 onto current_playlist
+        self.play_at_index(index.row())
 
     # ---------------- Playback control ----------------
     def play_at_index(self, idx: int):
         if idx < 0 or idx >= len(self.current_playlist):
             return
         self.current_index = idx
-        file_path = self.current_playlist[idx]
+        file_path, name, _ = self.current_playlist[idx]
         url = QUrl.fromLocalFile(file_path)
         self.player.setSource(url)
         self.player.play()
+        self._has_source = True
         self._update_cover_display()
-        self.song_list.setCurrentRow(idx)
-        self.status.showMessage(f"Playing: {Path(file_path).name}")
+        self.song_list.setCurrentIndex(self.track_model.index(idx))
+        self.status.showMessage(f"Playing: {name}")
 
     def play_pause(self):
         state = self.player.playbackState()
         if state == QMediaPlayer.PlayingState:
             self.player.pause()
-        else:
+        elif self._has_source:
+            # paused on a loaded track: resume it
+            self.player.play()
+        elif self.current_playlist:
             # if nothing loaded, try to play first from playlist
-            if not self.player.source().isLocalFile():
-                if self.current_playlist:
-                    self.play_at_index(self.current_index if self.current_index >= 0 else 0)
-                else:
-                    self.status.showMessage("No track selected.", 3000)
-                    return
-            else:
-                self.player.play()
+            self.play_at_index(self.current_index if self.current_index >= 0 else 0)
+        else:
+            self.status.showMessage("No track selected.", 3000)
 
     def stop(self):
         self.player.stop()
+        self._has_source = False
 
     def prev_track(self):
         if not self.current_playlist:
@@ -417,7 +626,6 @@ class MusicPlayerWindow(QMainWindow):
         if not self.current_playlist:
             return
         if self.shuffle_btn.isChecked():
-            import random
             new_idx = random.randrange(len(self.current_playlist))
         else:
             new_idx = self.current_index + 1
@@ -430,32 +638,52 @@ class MusicPlayerWindow(QMainWindow):
 
     def on_playback_state_changed(self, state):
         if state == QMediaPlayer.PlayingState:
-            self.play_btn.setIcon(self.style().standardIcon(QStyle.SP_MediaPause))
+            self.play_btn.setIcon(self._icon_pause)
+            self.ui_timer.start()
         else:
-            self.play_btn.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
+            self.play_btn.setIcon(self._icon_play)
+            self.ui_timer.stop()
 
     def on_volume_changed(self, value):
         self.audio_out.setVolume(value / 100.0)
 
     # ---------------- Position / seeker ----------------
     def on_position_changed(self, pos):
+        self._last_pos_signal = time.monotonic()
         if self.is_seeking:
             return
-        duration = self.player.duration()
-        if duration > 0:
-            val = int((pos / duration) * 1000)
-            self.seek_slider.setValue(val)
-        self.time_label.setText(format_ms(pos))
+        self._show_position(pos, self.player.duration())
 
     def on_duration_changed(self, duration):
-        self.duration_label.setText(format_ms(duration))
+        self._set_duration_text(format_ms(duration))
+
+    def _show_position(self, pos, duration):
+        if duration > 0:
+            val = (pos * 1000) // duration
+            # compare with the live value: keyboard, wheel and page steps move
+            # the slider without going through press/release
+            if val != self.seek_slider.value():
+                self.seek_slider.blockSignals(True)
+                self.seek_slider.setValue(val)
+                self.seek_slider.blockSignals(False)
+        self._set_time_text(format_ms(pos))
+
+    def _set_time_text(self, text):
+        if text != self._last_pos_text:
+            self.time_label.setText(text)
+            self._last_pos_text = text
+
+    def _set_duration_text(self, text):
+        if text != self._last_dur_text:
+            self.duration_label.setText(text)
+            self._last_dur_text = text
 
     def on_seek_slider_moved(self, value):
         # user is dragging; show tentative time
         duration = self.player.duration()
         if duration > 0:
-            ms = int((value / 1000) * duration)
-            self.time_label.setText(format_ms(ms))
+            ms = (value * duration) // 1000
+            self._set_time_text(format_ms(ms))
 
     def _seeker_pressed(self):
         self.is_seeking = True
@@ -465,29 +693,29 @@ class MusicPlayerWindow(QMainWindow):
         value = self.seek_slider.value()
         duration = self.player.duration()
         if duration > 0:
-            ms = int((value / 1000) * duration)
+            ms = (value * duration) // 1000
             self.player.setPosition(ms)
         self.is_seeking = False
 
     def _periodic_update(self):
-        # keep time label accurate if no signals
+        # keep time label accurate if no signals; positionChanged already
+        # covers it while it keeps firing
+        if time.monotonic() - self._last_pos_signal < 1.0:
+            return
         if not self.is_seeking:
             pos = self.player.position()
             dur = self.player.duration()
-            if dur > 0:
-                self.seek_slider.setValue(int((pos / dur) * 1000))
-            self.time_label.setText(format_ms(pos))
-            self.duration_label.setText(format_ms(dur))
+            self._show_position(pos, dur)
+            self._set_duration_text(format_ms(dur))
 
     # ---------------- Cover (letter) display ----------------
     def _update_cover_display(self):
         # If a track is selected display its first letter; else show folder letter / placeholder
         accent = getattr(self, "_accent_color", QColor(THEMES["Deep Purple / Pink (default)"]["accent"]))
         text_color = QColor("#ffffff")
-        size = 64
 
         if self.current_playlist and 0 <= self.current_index < len(self.current_playlist):
-            name = Path(self.current_playlist[self.current_index]).stem
+            letter = self.current_playlist[self.current_index][2]
         else:
             # try to display folder name
             title = self.playlist_title.text()
@@ -495,23 +723,23 @@ class MusicPlayerWindow(QMainWindow):
                 name = Path(title).name if title != "Select a folder on the left" else "M"
             else:
                 name = "M"
-        letter = (name[0] if name else "?").upper()
-        pix = make_letter_pixmap(letter, size, accent, text_color)
+            letter = (name[0] if name else "?").upper()
+        pix = self._letter_atlas.get(letter)
+        if pix is None:
+            pix = make_letter_pixmap(letter, self.COVER_SIZE, accent, text_color)
         self.cover_label.setPixmap(pix)
 
     # ---------------- track end handling ----------------
-    # (QMediaPlayer in Qt6 may emit position/duration and we can detect end by comparing)
-    # We'll use a timer to detect near-end and auto-advance.
-    def _detect_track_end_and_advance(self):
-        if self.player.duration() <= 0:
+    def _on_media_status(self, status):
+        # QMediaPlayer reports EndOfMedia exactly once when a track finishes
+        if status != QMediaPlayer.EndOfMedia:
+            return
+        # at the end of the folder without repeat/shuffle, stop instead of replaying the last track
+        if (not self.shuffle_btn.isChecked() and not self.repeat_btn.isChecked()
+                and self.current_index >= len(self.current_playlist) - 1):
             return
-        if self.player.position() >= max(0, self.player.duration() - 200):  # in ms near end
-            # if playing and not repeating one, move next
-            if self.player.playbackState() == QMediaPlayer.PlayingState:
-                # small delay to avoid repeated triggers
-                self.next_track()
+        self.next_track()
 
-    # Not used directly but kept for extension
     # ---------------- cleanup ----------------
     def closeEvent(self, event):
         self.player.stop()
@@ -521,6 +749,8 @@ class MusicPlayerWindow(QMainWindow):
 # ---------- Run ----------
 def main():
     app = QApplication(sys.argv)
+    # letter tiles are small; 2 MB holds every size/accent combination in use
+    QPixmapCache.setCacheLimit(2048)
     # set app icon (optional)
     try:
         app.setWindowIcon(QIcon.fromTheme("media-playback-start"))